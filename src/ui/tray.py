@@ -1,16 +1,23 @@
 """System tray integration."""
 
+import logging
 import os
 import sys
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import pyqtSignal, QObject
+from PyQt6.QtGui import QIcon, QImageReader, QPixmap
+from PyQt6.QtCore import pyqtSignal, QObject, QTimer, QRunnable, QThreadPool, QSize
 
 from ..config.constants import APP_NAME, STATE_IDLE, STATE_RECORDING, STATE_PROCESSING, STATE_ERROR
 from ..config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Bound at module load so hot paths (state changes, tray activation) skip the
+# attribute lookups and argument tuple construction when DEBUG is filtered out
+# - the normal production configuration.
+_dbg = logger.debug
+_is_dbg = logger.isEnabledFor
+
 
 def get_assets_dir() -> str:
     """Get the assets directory path, works for both dev and PyInstaller."""
@@ -26,6 +33,55 @@ def get_assets_dir() -> str:
 ASSETS_DIR = get_assets_dir()
 
 
+# Rasterization size for background-loaded icons; large enough for HiDPI trays
+_ICON_RENDER_SIZE = 128
+
+
+class _StateMap(dict):
+    """Dict keyed by app state that falls back to the IDLE entry on a miss.
+
+    Collapses the two-lookup `d.get(state, d[STATE_IDLE])` pattern into a
+    single probe.
+    """
+
+    def __missing__(self, _key):
+        return self[STATE_IDLE]
+
+
+_TOOLTIPS = _StateMap({
+    STATE_IDLE: f"{APP_NAME} - Ready",
+    STATE_RECORDING: f"{APP_NAME} - Recording...",
+    STATE_PROCESSING: f"{APP_NAME} - Processing...",
+    STATE_ERROR: f"{APP_NAME} - Error",
+})
+
+
+class _IconLoader(QRunnable):
+    """Decode non-idle state icons off the GUI thread.
+
+    QImage decoding is thread-safe; only the QPixmap/QIcon conversion must
+    happen on the GUI thread, so the worker ships QImages back via a signal.
+    """
+
+    class Signals(QObject):
+        loaded = pyqtSignal(dict)  # state -> QImage
+
+    def __init__(self, paths: dict):
+        super().__init__()
+        self._paths = paths
+        self.signals = self.Signals()
+
+    def run(self) -> None:
+        images = {}
+        for state, path in self._paths.items():
+            reader = QImageReader(path)
+            reader.setScaledSize(QSize(_ICON_RENDER_SIZE, _ICON_RENDER_SIZE))
+            image = reader.read()
+            if not image.isNull():
+                images[state] = image
+        self.signals.loaded.emit(images)
+
+
 class TrayIcon(QObject):
     """System tray icon with context menu."""
 
@@ -44,21 +100,45 @@ class TrayIcon(QObject):
         self._tray = QSystemTrayIcon(parent)
         self._state = STATE_IDLE
         self._widget_visible = True
+        # Python-side visibility cache so is_visible() polling does not cross
+        # into Qt on every call; kept in sync by show()/hide()
+        self._visible = False
+        # Pre-show state changes (e.g. model load) only mark the icon dirty;
+        # show() applies the final state once
+        self._icon_dirty = False
         self._setup_icons()
         self._setup_menu()
         self._update_icon()
         logger.debug("TrayIcon initialized successfully")
 
     def _setup_icons(self) -> None:
-        """Load PNG icons for different states from assets folder."""
+        """Load state icons, deferring the non-idle ones to a worker thread.
+
+        Only the idle icon is needed for the first frame; the other three
+        are decoded on QThreadPool and installed back on the GUI thread so
+        __init__ pays for a single icon load. SVG sources let Qt render at
+        the exact requested size and DPI instead of downscaling large PNGs.
+        """
         logger.debug("Loading tray icons from %s", ASSETS_DIR)
-        self._icons = {
-            STATE_IDLE: QIcon(os.path.join(ASSETS_DIR, 'mic_ico_grey_tray.png')),
-            STATE_RECORDING: QIcon(os.path.join(ASSETS_DIR, 'mic_ico_blue_tray.png')),
-            STATE_PROCESSING: QIcon(os.path.join(ASSETS_DIR, 'mic_ico_orange_tray.png')),
-            STATE_ERROR: QIcon(os.path.join(ASSETS_DIR, 'mic_ico_red_tray.png')),
+        self._icons = _StateMap({
+            STATE_IDLE: QIcon(os.path.join(ASSETS_DIR, 'mic_ico_grey_tray.svg')),
+        })
+        deferred = {
+            STATE_RECORDING: os.path.join(ASSETS_DIR, 'mic_ico_blue_tray.svg'),
+            STATE_PROCESSING: os.path.join(ASSETS_DIR, 'mic_ico_orange_tray.svg'),
+            STATE_ERROR: os.path.join(ASSETS_DIR, 'mic_ico_red_tray.svg'),
         }
+        loader = _IconLoader(deferred)
+        loader.signals.loaded.connect(self._install_icons)
+        QThreadPool.globalInstance().start(loader)
+
+    def _install_icons(self, images: dict) -> None:
+        """Convert worker-decoded QImages to QIcons on the GUI thread."""
+        for state, image in images.items():
+            self._icons[state] = QIcon(QPixmap.fromImage(image))
         logger.debug("Tray icons loaded for %d states", len(self._icons))
+        # The state may have advanced past IDLE while icons were loading
+        self._update_icon()
 
     def _setup_menu(self) -> None:
         """Create the context menu."""
@@ -108,72 +188,95 @@ class TrayIcon(QObject):
         else:
             self.show_widget.emit()
 
+    # Dict dispatch instead of an if/elif ladder on ActivationReason:
+    # left click toggles recording, middle click toggles the widget.
+    _ACTIVATION_HANDLERS = {
+        QSystemTrayIcon.ActivationReason.Trigger: lambda self: self.toggle_recording.emit(),
+        QSystemTrayIcon.ActivationReason.MiddleClick: lambda self: self._toggle_widget(),
+    }
+
     def _on_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         """Handle tray icon activation."""
-        logger.debug("Tray icon activated with reason: %s", reason)
-        if reason == QSystemTrayIcon.ActivationReason.Trigger:
-            # Left click - toggle recording
-            logger.debug("Left click detected, emitting toggle_recording signal")
-            self.toggle_recording.emit()
-        elif reason == QSystemTrayIcon.ActivationReason.MiddleClick:
-            # Middle click - toggle widget
-            logger.debug("Middle click detected, toggling widget")
-            self._toggle_widget()
+        if _is_dbg(logging.DEBUG):
+            _dbg("Tray icon activated with reason: %s", reason)
+        handler = self._ACTIVATION_HANDLERS.get(reason)
+        if handler is not None:
+            handler(self)
 
     def set_state(self, state: str) -> None:
         """Update icon and menu based on state."""
-        logger.debug("Setting tray state: %s", state)
+        if _is_dbg(logging.DEBUG):
+            _dbg("Setting tray state: %s", state)
         self._state = state
         self._update_icon()
         self._update_menu()
 
     def _update_icon(self) -> None:
-        """Update tray icon based on state."""
-        icon = self._icons.get(self._state, self._icons[STATE_IDLE])
-        self._tray.setIcon(icon)
-
-        # Update tooltip
-        tooltips = {
-            STATE_IDLE: f"{APP_NAME} - Ready",
-            STATE_RECORDING: f"{APP_NAME} - Recording...",
-            STATE_PROCESSING: f"{APP_NAME} - Processing...",
-            STATE_ERROR: f"{APP_NAME} - Error",
-        }
-        tooltip = tooltips.get(self._state, APP_NAME)
-        self._tray.setToolTip(tooltip)
-        logger.debug("Updated tray icon and tooltip for state: %s", self._state)
+        """Update tray icon based on state, deferring while the tray is hidden.
+
+        Qt ignores setIcon/setToolTip on a hidden tray icon but still does
+        the internal bookkeeping, so coalesce any pre-show state changes and
+        let show() apply the latest one.
+        """
+        if not self._visible:
+            self._icon_dirty = True
+            return
+        self._apply_icon()
+
+    def _apply_icon(self) -> None:
+        """Push the current state's icon and tooltip to Qt."""
+        self._tray.setIcon(self._icons[self._state])
+        self._tray.setToolTip(_TOOLTIPS[self._state])
+        if _is_dbg(logging.DEBUG):
+            _dbg("Updated tray icon and tooltip for state: %s", self._state)
 
     def _update_menu(self) -> None:
         """Update menu text based on state."""
-        if self._state == STATE_RECORDING:
-            self._record_action.setText("Stop Recording")
-        else:
-            self._record_action.setText("Start Recording")
+        text = "Stop Recording" if self._state == STATE_RECORDING else "Start Recording"
+        # Skip the setText when unchanged - Qt marks the menu dirty on every
+        # setText call, forcing a relayout on next show even for identical text
+        if self._record_action.text() != text:
+            self._record_action.setText(text)
 
     def set_widget_visible(self, visible: bool) -> None:
         """Update widget visibility state."""
         logger.debug("Setting widget visibility state: %s", visible)
         self._widget_visible = visible
-        if visible:
-            self._widget_action.setText("Hide Widget")
-        else:
-            self._widget_action.setText("Show Widget")
+        text = "Hide Widget" if visible else "Show Widget"
+        if self._widget_action.text() != text:
+            self._widget_action.setText(text)
 
     def show(self) -> None:
         """Show the tray icon."""
         logger.debug("Showing tray icon")
+        # Flush the deferred icon before showing - making the tray visible
+        # with a null icon triggers a Qt warning and a briefly iconless
+        # shell entry
+        if self._icon_dirty:
+            self._icon_dirty = False
+            self._apply_icon()
         self._tray.show()
+        self._visible = True
+        # The shell can silently reject the icon (e.g. no tray available yet
+        # during a shell restart); re-sync the cache once Qt has settled.
+        QTimer.singleShot(0, self._sync_visibility)
 
     def hide(self) -> None:
         """Hide the tray icon."""
         logger.debug("Hiding tray icon")
         self._tray.hide()
+        self._visible = False
+
+    def _sync_visibility(self) -> None:
+        """Reconcile the cached visibility flag with Qt's actual state."""
+        self._visible = self._tray.isVisible()
 
     def show_message(self, title: str, message: str, duration: int = 3000) -> None:
         """Show a balloon notification."""
-        logger.debug("Showing tray message: title=%s, message=%s, duration=%d", title, message, duration)
+        if _is_dbg(logging.DEBUG):
+            _dbg("Showing tray message: title=%s, message=%s, duration=%d", title, message, duration)
         self._tray.showMessage(title, message, QSystemTrayIcon.MessageIcon.Information, duration)
 
     def is_visible(self) -> bool:
-        """Check if tray icon is visible."""
-        return self._tray.isVisible()
+        """Check if tray icon is visible (cached; avoids a Qt call per poll)."""
+        return self._visible
@@ -2,15 +2,15 @@
 
 import math
 import os
-import random
 import sys
-from collections import deque
+
+import numpy as np
 from PyQt6.QtWidgets import QWidget, QApplication, QLabel, QVBoxLayout
-from PyQt6.QtCore import Qt, QPoint, QTimer, pyqtSignal, QRectF, QPointF
+from PyQt6.QtCore import Qt, QPoint, QRect, QTimer, pyqtSignal, QPointF
 from PyQt6.QtGui import (
-    QPainter, QColor, QPen, QBrush, QRadialGradient,
+    QPainter, QColor, QPen, QRadialGradient,
     QPainterPath, QPaintEvent, QMouseEvent, QEnterEvent, QFont,
-    QLinearGradient, QPixmap
+    QPixmap
 )
 
 
@@ -20,6 +20,9 @@ from PyQt6.QtGui import (
 BAR_STRIP_MULTIPLIER = 2
 AUDIO_HISTORY_SECONDS = 5.0
 NUM_BARS = 60
+# Fade alphas are quantized into this many buckets so all bars sharing a
+# bucket can be stroked as one QPainterPath instead of 60 drawLine calls
+NUM_FADE_BUCKETS = 10
 
 
 def get_assets_dir() -> str:
@@ -43,6 +46,24 @@ ICON_FILES = {
     'error': 'mic_ico_red_light.png',
 }
 
+# Absolute icon paths, joined once at import instead of per load
+_ICON_PATHS = {state: os.path.join(ASSETS_DIR, fn) for state, fn in ICON_FILES.items()}
+
+# Raw state pixmaps, shared across widget instances. Loaded lazily on first
+# use because QPixmap needs a QGuiApplication, which doesn't exist yet when
+# this module is imported.
+_RAW_PIXMAPS: dict = {}
+
+
+def _raw_pixmap(state: str):
+    """Return the decoded (unscaled) mic pixmap for a state, loading it once."""
+    pixmap = _RAW_PIXMAPS.get(state)
+    if pixmap is None:
+        path = _ICON_PATHS.get(state, _ICON_PATHS['idle'])
+        pixmap = QPixmap(path)
+        _RAW_PIXMAPS[state] = pixmap
+    return pixmap
+
 from ..config.constants import (
     WIDGET_SIZES,
     DEFAULT_WIDGET_SIZE,
@@ -66,6 +87,58 @@ def clamp(value: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
     return max(min_val, min(max_val, value))
 
 
+def _with_alpha(color_name: str, alpha: float) -> QColor:
+    """Build a QColor with its alpha pre-set (for quantized color palettes)."""
+    color = QColor(color_name)
+    color.setAlphaF(alpha)
+    return color
+
+
+# Cached primary-screen geometry. primaryScreen()/availableGeometry() both
+# cross the Qt binding boundary, so positioning and hover paths read this
+# cache instead; it refreshes when the primary screen object changes and is
+# invalidated by the primaryScreenChanged signal.
+_cached_geom: QRect | None = None
+_cached_screen = None
+_geom_hooked = False
+
+
+def _invalidate_geom(*_args) -> None:
+    global _cached_geom, _cached_screen
+    _cached_geom = None
+    _cached_screen = None
+
+
+def _get_geom() -> QRect | None:
+    """Available geometry of the primary screen, cached between screen changes."""
+    global _cached_geom, _cached_screen, _geom_hooked
+    screen = QApplication.primaryScreen()
+    if screen is None:
+        return None
+    if screen is not _cached_screen or _cached_geom is None:
+        if not _geom_hooked:
+            app = QApplication.instance()
+            if app is not None:
+                app.primaryScreenChanged.connect(_invalidate_geom)
+                _geom_hooked = True
+        _cached_screen = screen
+        _cached_geom = screen.availableGeometry()
+    return _cached_geom
+
+
+def _shape_strip_levels(history: np.ndarray, pos: int, max_half_height: float):
+    """Numeric kernel for the bar strip: reorder the ring buffer and shape levels.
+
+    Returns (ordered_levels, half_heights) with index 0 = oldest sample.
+    Deliberately free of Qt objects and Python loops so the whole strip costs
+    a handful of vector ops per paint - and so the kernel could be handed to a
+    JIT (e.g. numba.njit) wholesale if a profile ever justified the dependency.
+    """
+    ordered = np.concatenate((history[pos:], history[:pos]))
+    half_heights = np.sqrt(np.clip(ordered, 0.0, 1.0)) * max_half_height
+    return ordered, half_heights
+
+
 # Thickness scale factors by widget size
 THICKNESS_SCALE = {
     "compact": 0.6,
@@ -74,8 +147,25 @@ THICKNESS_SCALE = {
 }
 
 
-class VerticalAudioBar:
-    """A vertical audio-reactive bar overlaid on the mic icon."""
+class VerticalBarArray:
+    """The vertical audio-reactive bars as a structure of arrays.
+
+    Replaces the old one-object-per-bar layout: every per-bar field lives in
+    a float32 array, so the spring-physics update is a handful of vectorized
+    ops instead of seven Python method calls per tick.
+    """
+
+    # No __dict__: the update runs every animation tick, so attribute reads
+    # go through C-level slot offsets instead of dict probes
+    __slots__ = (
+        "count", "x_offsets", "max_height", "min_height", "sensitivity",
+        "spring", "damping", "phase_offset", "_cos_phase", "_sin_phase",
+        "current_height", "target_height", "velocity", "_noise",
+        "_noise_idx", "pen_group", "pens",
+    )
+
+    # Audio threshold - only animate with actual sound
+    THRESHOLD = 0.05
 
     # Blue spectrum colors (outer to center pattern: 1,2,3,4,3,2,1)
     COLORS = [
@@ -88,65 +178,102 @@ class VerticalAudioBar:
         "#00e5ff",  # Cyan (outer)
     ]
 
-    def __init__(self, index: int, x_offset: float, max_height: float):
-        self.index = index
-        self.x_offset = x_offset  # Offset from center
-        self.max_height = max_height
-        self.current_height = 0.0
-        self.target_height = 0.0
-        self.velocity = 0.0
+    def __init__(self, count: int, x_offsets, max_height: float):
+        index = np.arange(count, dtype=np.float32)
+        self.count = count
+        self.x_offsets = np.asarray(x_offsets, dtype=np.float32)
+        self.max_height = np.float32(max_height)
+        # Minimum height when idle (slight visual presence)
+        self.min_height = np.float32(max_height * 0.05)
 
-        # Center bars (index 2,3,4) are more sensitive
-        center_distance = abs(index - 3)  # 0 for center, 3 for edges
-        self.sensitivity = 1.0 - (center_distance * 0.15)  # Center: 1.0, edges: 0.55
+        # Center bars (index 2,3,4) are more sensitive: center 1.0, edges 0.55
+        self.sensitivity = 1.0 - np.abs(index - 3) * np.float32(0.15)
 
         # Varying spring characteristics for organic movement
-        self.spring = 0.25 + random.uniform(0, 0.1)
-        self.damping = 0.65 + random.uniform(0, 0.1)
-
-        # Phase offset for staggered response (wave effect)
-        self.phase_offset = index * 0.08
-
-        # Color from spectrum
-        self.color = self.COLORS[index]
-
-        # Minimum height when idle (slight visual presence)
-        self.min_height = max_height * 0.05
-
-    def update(self, audio_level: float, time_offset: float = 0.0):
-        """Update bar height based on audio level with spring physics."""
-        # Audio threshold - only animate with actual sound
-        THRESHOLD = 0.05
+        self.spring = (0.25 + np.random.uniform(0, 0.1, count)).astype(np.float32)
+        self.damping = (0.65 + np.random.uniform(0, 0.1, count)).astype(np.float32)
+
+        # Phase offsets for staggered response (wave effect), stored as
+        # cos/sin tables so each update folds them in via the angle-addition
+        # identity sin(t + p) = sin(t)cos(p) + cos(t)sin(p) - two scalar trig
+        # calls per tick instead of an n-element transcendental pass
+        self.phase_offset = index * np.float32(0.08)
+        phase10 = self.phase_offset * 10
+        self._cos_phase = np.cos(phase10).astype(np.float32)
+        self._sin_phase = np.sin(phase10).astype(np.float32)
+
+        self.current_height = np.full(count, self.min_height, dtype=np.float32)
+        self.target_height = np.zeros(count, dtype=np.float32)
+        self.velocity = np.zeros(count, dtype=np.float32)
+
+        # Precomputed jitter ring buffer: one RNG fill at construction
+        # replaces a per-tick np.random.uniform call; updates consume
+        # contiguous slices and wrap via the index
+        self._noise = np.random.uniform(0.85, 1.15, 4096).astype(np.float32)
+        self._noise_idx = 0
+
+        # The 7-bar spectrum only has 4 distinct colors (symmetric pattern),
+        # so bars sharing a color are stroked as one QPainterPath. Keep one
+        # pen per distinct color (30% draw alpha baked in) plus an
+        # index -> pen-group table for the draw loop.
+        unique_colors: list[str] = []
+        self.pen_group = []
+        for color_name in self.COLORS[:count]:
+            if color_name not in unique_colors:
+                unique_colors.append(color_name)
+            self.pen_group.append(unique_colors.index(color_name))
+        self.pens = []
+        for color_name in unique_colors:
+            color = QColor(color_name)
+            color.setAlphaF(0.30)
+            self.pens.append(QPen(color, 0, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
 
-        if audio_level < THRESHOLD:
+    def update(self, audio_level: float, time_offset: float = 0.0) -> None:
+        """Update all bar heights with vectorized spring physics."""
+        if audio_level < self.THRESHOLD:
             # No sound - settle to minimum
-            self.target_height = self.min_height
+            self.target_height.fill(self.min_height)
         else:
-            # Sound detected - animate based on level
-            # Apply phase offset for wave effect
-            phase_multiplier = 0.8 + 0.4 * math.sin(time_offset + self.phase_offset * 10)
-
-            # Calculate target with sensitivity and phase
-            normalized_audio = (audio_level - THRESHOLD) / (1.0 - THRESHOLD)
-            self.target_height = self.min_height + (
-                self.max_height - self.min_height
-            ) * normalized_audio * self.sensitivity * phase_multiplier
+            # Sound detected - animate based on level, with per-bar phase
+            # offsets for the wave effect (precomputed cos/sin tables)
+            sin_t = math.sin(time_offset)
+            cos_t = math.cos(time_offset)
+            phase_multiplier = 0.8 + 0.4 * (sin_t * self._cos_phase + cos_t * self._sin_phase)
+            normalized_audio = (audio_level - self.THRESHOLD) / (1.0 - self.THRESHOLD)
+            np.multiply(
+                (self.max_height - self.min_height) * normalized_audio,
+                self.sensitivity * phase_multiplier,
+                out=self.target_height,
+            )
+            self.target_height += self.min_height
 
-            # Add slight randomness for organic feel
-            self.target_height *= random.uniform(0.85, 1.15)
+            # Slight randomness for organic feel, read from the noise ring
+            start = self._noise_idx
+            end = start + self.count
+            if end <= self._noise.size:
+                jitter = self._noise[start:end]
+            else:
+                end -= self._noise.size
+                jitter = np.concatenate((self._noise[start:], self._noise[:end]))
+            self._noise_idx = end % self._noise.size
+            self.target_height *= jitter
 
-        self.target_height = clamp(self.target_height, self.min_height, self.max_height)
+        np.clip(self.target_height, self.min_height, self.max_height, out=self.target_height)
 
         # Spring physics
-        force = (self.target_height - self.current_height) * self.spring
-        self.velocity = (self.velocity + force) * self.damping
+        self.velocity += (self.target_height - self.current_height) * self.spring
+        self.velocity *= self.damping
         self.current_height += self.velocity
-        self.current_height = clamp(self.current_height, self.min_height, self.max_height)
+        np.clip(self.current_height, self.min_height, self.max_height, out=self.current_height)
 
 
 class PulseRing:
     """A simple expanding pulse ring."""
 
+    # No __dict__: fixed-field instances read at 60 Hz get C-level offset
+    # attribute access and a much smaller footprint
+    __slots__ = ("progress", "active")
+
     def __init__(self):
         self.progress = 0.0
         self.active = False
@@ -164,8 +291,10 @@ class PulseRing:
 
     @property
     def opacity(self) -> float:
-        # Fade out as it expands
-        return clamp(1.0 - self.progress ** 0.5)
+        # Fade out as it expands. math.sqrt is a C intrinsic (cheaper than
+        # float.__pow__) and the clamp is inlined to skip a call per read.
+        value = 1.0 - math.sqrt(self.progress)
+        return 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
 
 
 class InfoTooltip(QWidget):
@@ -197,6 +326,13 @@ class InfoTooltip(QWidget):
         self._action.setStyleSheet(f"color: #cccccc; background: transparent;")
         layout.addWidget(self._action)
 
+        # Reusable paint objects - the tooltip repaints on every show/move
+        self._bg_color = QColor(COLOR_BG_DARK)
+        self._bg_color.setAlpha(240)
+        border_color = QColor(COLOR_WIDGET_RECORDING)
+        border_color.setAlpha(150)
+        self._border_pen = QPen(border_color, 1)
+
         self.adjustSize()
 
     def set_text(self, title: str, action: str) -> None:
@@ -210,13 +346,8 @@ class InfoTooltip(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        bg_color = QColor(COLOR_BG_DARK)
-        bg_color.setAlpha(240)
-        painter.setBrush(bg_color)
-
-        border_color = QColor(COLOR_WIDGET_RECORDING)
-        border_color.setAlpha(150)
-        painter.setPen(QPen(border_color, 1))
+        painter.setBrush(self._bg_color)
+        painter.setPen(self._border_pen)
 
         rect = self.rect().adjusted(1, 1, -1, -1)
         painter.drawRoundedRect(rect, 6, 6)
@@ -232,9 +363,8 @@ class InfoTooltip(QWidget):
         tooltip_y = widget_center.y() + widget_size // 4
 
         # Get screen boundaries
-        screen = QApplication.primaryScreen()
-        if screen:
-            geometry = screen.availableGeometry()
+        geometry = _get_geom()
+        if geometry:
             padding = 5
 
             # Adjust horizontal position if outside screen
@@ -271,20 +401,37 @@ class FloatingWidget(QWidget):
         self._drag_start_pos: QPoint | None = None
         self._drag_start_widget_pos: QPoint | None = None
         self._total_drag_distance = 0
+        # Coalesced drag target: mouse samples can arrive faster than the
+        # frame rate, so moves are flushed once per event-loop pass
+        self._pending_move: QPoint | None = None
 
-        # Animation state
+        # Animation state. Visualizer fields are pre-seeded here so every
+        # attribute exists before _setup_ui/_init_visualizers run and no
+        # caller ever needs a hasattr guard.
         self._pulse_rings: list[PulseRing] = []  # retained but unused (legacy)
+        self._vertical_bars = VerticalBarArray(0, [], 0.0)
+        self._animation_time = 0.0
         self._glow_intensity = 0.0
         self._breathing_scale = 1.0
         self._breathing_direction = 1
         self._idle_glow = 0.6
         self._idle_glow_direction = 1
+        # Idle ticks are decimated 2:1 (see _update_animations)
+        self._idle_tick = 0
+        # Last idle-glow alpha (0-255) and border width (quarter-pixel steps)
+        # that triggered a repaint; ticks whose visual delta rounds to zero
+        # are skipped
+        self._last_painted_glow = -1
+        self._last_painted_border_w = -1
         self._idle_border_width = 2.5
         self._error_flash_alpha = 0
         self._rotation_offset = 0.0  # Slow rotation for visual interest
 
-        # Recording bar strip — rolling 5s of volume samples (newest = right)
-        self._audio_history: deque[float] = deque([0.0] * NUM_BARS, maxlen=NUM_BARS)
+        # Recording bar strip — rolling 5s of volume samples kept as a NumPy
+        # ring buffer (write head at _history_pos) so the per-paint shaping
+        # math runs as vector ops instead of a Python loop
+        self._audio_history = np.zeros(NUM_BARS, dtype=np.float32)
+        self._history_pos = 0
         self._sample_accumulator = 0.0
         # ms-per-sample: spread NUM_BARS evenly across AUDIO_HISTORY_SECONDS
         self._sample_period_ms = AUDIO_HISTORY_SECONDS * 1000.0 / NUM_BARS
@@ -295,12 +442,55 @@ class FloatingWidget(QWidget):
         self._red_dot_phase = 0.0       # 0..1 looping; recording centre dot
         self._yellow_pulse_phase = 0.0  # 0..1 looping; processing whole-widget pulse
 
+        # Reusable paint objects, mutated in place per frame instead of
+        # reallocating QColor/QPen/QBrush on every paintEvent
+        self._bg_color = QColor(COLOR_BG_DARK)
+        self._bg_color.setAlphaF(0.10)
+        self._border_pen = QPen()
+        self._processing_color = QColor(COLOR_WIDGET_PROCESSING)
+        self._idle_glow_color = QColor(COLOR_WIDGET_IDLE)
+        self._error_flash_color = QColor(COLOR_WIDGET_ERROR)
+        self._recording_dot_color = QColor(COLOR_WIDGET_RECORDING)
+        # Border color per state, resolved once in set_state so paintEvent
+        # does zero lookups. Dedicated instances: the border mutates alpha in
+        # place for the idle/recording states.
+        self._state_colors = {
+            STATE_IDLE: QColor(COLOR_WIDGET_IDLE),
+            STATE_RECORDING: QColor(COLOR_WIDGET_RECORDING),
+            STATE_PROCESSING: QColor(COLOR_WIDGET_PROCESSING),
+            STATE_ERROR: QColor(COLOR_WIDGET_ERROR),
+        }
+        self._state_color = self._state_colors[STATE_IDLE]
+        # Quantized alpha palettes for the animated border colors: 32 levels
+        # are indistinguishable from continuous alpha at these ramps, and an
+        # index into a prebuilt tuple replaces a setAlphaF binding call per
+        # frame. Recording maps level 0..1 onto its 0.8..1.0 alpha range.
+        self._idle_border_palette = tuple(
+            _with_alpha(COLOR_WIDGET_IDLE, i / 31) for i in range(32)
+        )
+        self._recording_border_palette = tuple(
+            _with_alpha(COLOR_WIDGET_RECORDING, 0.8 + (i / 31) * 0.2) for i in range(32)
+        )
+
         # Tooltip (commented out - may use for onboarding later)
         # self._tooltip = InfoTooltip()
         # self._tooltip.hide()
 
+        # Per-state animation tick dispatch: set_state re-binds self._tick so
+        # the timer callback runs exactly one state's branch
+        self._ticks = {
+            STATE_IDLE: self._tick_idle,
+            STATE_RECORDING: self._tick_recording,
+            STATE_PROCESSING: self._tick_processing,
+            STATE_ERROR: self._tick_error,
+        }
+        self._tick = self._tick_idle
+
         # Timers (created but not started until after _setup_ui initializes visualizers)
         self._animation_timer = QTimer(self)
+        # Coarse by default: only the audio-reactive recording state needs
+        # ms-accurate pacing; coarse timers let the OS batch wakeups
+        self._animation_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self._animation_timer.timeout.connect(self._update_animations)
 
         self._pulse_timer = QTimer(self)
@@ -313,7 +503,7 @@ class FloatingWidget(QWidget):
         self._setup_ui()
 
         # Start animation timer after visualizers are initialized
-        self._animation_timer.start(16)  # ~60fps
+        self._animation_timer.start(self._animation_interval())
 
     def _setup_ui(self) -> None:
         """Initialize the widget.
@@ -328,6 +518,9 @@ class FloatingWidget(QWidget):
             | Qt.WindowType.Tool
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # paintEvent covers the full visible region itself, so tell Qt not to
+        # erase/clear the widget background before each paint
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
         self.setMouseTracking(True)
         total_width = self._size * (1 + BAR_STRIP_MULTIPLIER)
         self.setFixedSize(total_width, self._size)
@@ -344,11 +537,73 @@ class FloatingWidget(QWidget):
         bar_spacing = icon_width / 8  # Space between bars
         max_bar_height = self._size * 0.4  # Max height of bars
 
-        self._vertical_bars: list[VerticalAudioBar] = []
-        for i in range(7):
-            # Calculate x offset from center (-3 to +3 bar positions)
-            x_offset = (i - 3) * bar_spacing
-            self._vertical_bars.append(VerticalAudioBar(i, x_offset, max_bar_height))
+        # X offsets from center (-3 to +3 bar positions); all other per-bar
+        # state lives in the structure-of-arrays VerticalBarArray
+        x_offsets = [(i - 3) * bar_spacing for i in range(7)]
+        self._vertical_bars = VerticalBarArray(7, x_offsets, max_bar_height)
+
+        # Scaled mic pixmaps keyed by (state, icon_size); sizes depend on the
+        # widget size, so the cache is rebuilt whenever set_size re-runs this
+        self._scaled_icon_cache: dict[tuple[str, int], QPixmap] = {}
+
+        # Pre-composited circle background + mic icon per state, used by the
+        # states whose icon never animates (idle/error) so a whole frame's
+        # static content lands in one drawPixmap call
+        self._static_base_cache: dict[str, QPixmap] = {}
+
+        # Blit origin for the mic icon, keyed like the scaled-icon cache; the
+        # centering arithmetic depends only on state and icon size
+        self._icon_pos_cache: dict[tuple[str, int], QPoint] = {}
+
+        # Dirty rects for targeted update() calls: the circle on the right
+        # and the bar strip on the left repaint on different cadences
+        total_width = self.width()
+        self._circle_rect = QRect(total_width - self._size, 0, self._size, self._size)
+        self._strip_rect = QRect(0, 0, total_width - self._size, self._size)
+
+        # Circle center, precomputed in both float and integer forms. The
+        # widget sizes are even, so the integer center is exact; int draw
+        # calls keep Qt's paint engine off the FP path for pixel-aligned
+        # elements (background, border, mic), while QPointF stays in use
+        # where sub-pixel positioning matters.
+        self._center = QPointF(total_width - self._size / 2, self._size / 2)
+        self._center_i = QPoint(total_width - self._size // 2, self._size // 2)
+
+        # Pre-rendered idle glow at full intensity; per-frame intensity is
+        # applied via painter opacity on the blit instead of re-rasterizing
+        # the radial gradient every idle frame
+        self._idle_glow_sprite = self._build_idle_glow_sprite()
+
+        # Gradient templates for the glow layers, reused across paints with
+        # only center/radius/stops mutated in place - QGradient is
+        # copy-on-write under Qt, so reuse avoids a build per layer per frame
+        self._glow_gradients = {
+            "outer": QRadialGradient(),
+            "processing": QRadialGradient(),
+        }
+
+        # Per-index lookup tables for the bar strip: x position and fade
+        # bucket depend only on bar index and widget size, so build them once
+        # here instead of allocating a QColor + QPen per bar per frame.
+        # Bars are grouped into NUM_FADE_BUCKETS alpha buckets sharing a pen,
+        # letting the paint loop stroke one path per bucket.
+        strip_width = self._size * BAR_STRIP_MULTIPLIER
+        bar_slot = strip_width / NUM_BARS
+        bar_thickness = max(2.0, bar_slot * 0.6)
+        base_color = QColor(COLOR_WIDGET_RECORDING)
+        self._strip_x = [(i + 0.5) * bar_slot for i in range(NUM_BARS)]
+        self._strip_bucket = [
+            min(NUM_FADE_BUCKETS - 1, i * NUM_FADE_BUCKETS // NUM_BARS)
+            for i in range(NUM_BARS)
+        ]
+        self._strip_bucket_pens = []
+        for b in range(NUM_FADE_BUCKETS):
+            color = QColor(base_color)
+            # Fade: opacity ramps from 0 at the left edge to 1 at the circle
+            color.setAlphaF(0.85 * (b + 1) / NUM_FADE_BUCKETS)
+            self._strip_bucket_pens.append(
+                QPen(color, bar_thickness, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+            )
 
         # Time counter for phase animation
         self._animation_time = 0.0
@@ -363,26 +618,35 @@ class FloatingWidget(QWidget):
         offset by total width to keep the visible circle anchored to the
         screen edge.
         """
-        screen = QApplication.primaryScreen()
-        if screen:
-            geometry = screen.availableGeometry()
+        geometry = _get_geom()
+        if geometry:
             x = geometry.width() - self.width() - 20
             y = 80
             self.move(x, y)
 
     def _ensure_on_screen(self) -> None:
         """Ensure widget stays within screen boundaries."""
-        screen = QApplication.primaryScreen()
-        if screen:
-            geometry = screen.availableGeometry()
+        geometry = _get_geom()
+        if geometry:
             pos = self.pos()
             new_x = pos.x()
             new_y = pos.y()
-
-            if new_x + self.width() > geometry.width():
-                new_x = geometry.width() - self.width() - 10
-            if new_y + self._size > geometry.height():
-                new_y = geometry.height() - self._size - 10
+            width = geometry.width()
+            height = geometry.height()
+
+            # Fast path: clearly interior, no clamping needed
+            if (
+                0 <= new_x
+                and new_x + self.width() <= width
+                and 0 <= new_y
+                and new_y + self._size <= height
+            ):
+                return
+
+            if new_x + self.width() > width:
+                new_x = width - self.width() - 10
+            if new_y + self._size > height:
+                new_y = height - self._size - 10
             if new_x < 0:
                 new_x = 10
             if new_y < 0:
@@ -393,7 +657,12 @@ class FloatingWidget(QWidget):
 
     def set_size(self, size_key: str) -> None:
         """Change widget size, keeping the CIRCLE position stable."""
-        if size_key in WIDGET_SIZES:
+        if size_key not in WIDGET_SIZES:
+            return
+        # Suppress intermediate repaints: resize, re-anchor and visualizer
+        # rebuild land as one consolidated update instead of several
+        self.setUpdatesEnabled(False)
+        try:
             # Preserve the circle's right edge before resize
             old_circle_right = self.x() + self.width()
             self._size_key = size_key
@@ -405,22 +674,14 @@ class FloatingWidget(QWidget):
             self.move(old_circle_right - total_width, self.y())
             self._init_visualizers()
             self._ensure_on_screen()
-            self.update()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
 
     def _get_scaled_thickness(self, base_thickness: float) -> float:
         """Get thickness scaled by widget size."""
         return base_thickness * self._thickness_scale
 
-    def _get_state_color(self) -> QColor:
-        """Get color for current state."""
-        colors = {
-            STATE_IDLE: COLOR_WIDGET_IDLE,
-            STATE_RECORDING: COLOR_WIDGET_RECORDING,
-            STATE_PROCESSING: COLOR_WIDGET_PROCESSING,
-            STATE_ERROR: COLOR_WIDGET_ERROR,
-        }
-        return QColor(colors.get(self._state, COLOR_WIDGET_IDLE))
-
     def _spawn_pulse(self) -> None:
         """Spawn a new pulse ring."""
         for ring in self._pulse_rings:
@@ -428,81 +689,167 @@ class FloatingWidget(QWidget):
                 ring.reset()
                 break
 
+    def _animation_interval(self) -> int:
+        """Timer interval for the current state: ~60fps while recording or
+        processing, ~30fps for the slow idle glow."""
+        if self._state in (STATE_RECORDING, STATE_PROCESSING):
+            return 16
+        return 33
+
+    def showEvent(self, event) -> None:
+        """Resume animation work when the widget becomes visible again."""
+        if not self._animation_timer.isActive():
+            self._animation_timer.start(self._animation_interval())
+        # Resume the strip sampler only if recording carried on while hidden
+        if self._state == STATE_RECORDING and not self._sample_timer.isActive():
+            self._sample_timer.start(int(self._sample_period_ms))
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        """Stop all periodic work while hidden - nothing is painted."""
+        self._animation_timer.stop()
+        self._pulse_timer.stop()
+        self._sample_timer.stop()
+        super().hideEvent(event)
+
     def _update_animations(self) -> None:
-        """Update all animations."""
-        needs_update = False
+        """Timer tick: dispatch to the current state's specialized handler.
+
+        `self._tick` is re-bound in set_state, so each tick runs only the
+        active state's work instead of testing every state branch at 60 Hz.
+        Animation ticks only affect the circle; the bar strip repaints
+        separately when a new sample lands (see _sample_audio_for_strip).
+        """
+        if not self.isVisible():
+            return
 
         # Smooth audio level for glow effect
         self._smoothed_audio += (self._audio_level - self._smoothed_audio) * 0.15
+        self._tick()
 
-        if self._state == STATE_RECORDING:
-            # Advance red-dot phase: ~1.2 cycles per second at 60fps
-            self._red_dot_phase = (self._red_dot_phase + 0.020) % 1.0
-            needs_update = True
-
-        # Yellow pulse during processing — slower than recording dot
-        if self._state == STATE_PROCESSING:
-            self._yellow_pulse_phase = (self._yellow_pulse_phase + 0.015) % 1.0
-            needs_update = True
+    def _tick_recording(self) -> None:
+        """Advance red-dot phase: ~1.2 cycles per second at 60fps."""
+        self._red_dot_phase = (self._red_dot_phase + 0.020) % 1.0
+        if self._error_flash_alpha > 0:
+            self._error_flash_alpha = max(0, self._error_flash_alpha - 10)
+        self.update(self._circle_rect)
 
-        # Update idle glow
-        if self._state == STATE_IDLE:
-            self._idle_glow += self._idle_glow_direction * 0.008
-            if self._idle_glow >= 1.0:
-                self._idle_glow_direction = -1
-            elif self._idle_glow <= 0.4:
-                self._idle_glow_direction = 1
+    def _tick_processing(self) -> None:
+        """Advance the yellow whole-widget pulse — slower than recording dot."""
+        self._yellow_pulse_phase = (self._yellow_pulse_phase + 0.015) % 1.0
+        if self._error_flash_alpha > 0:
+            self._error_flash_alpha = max(0, self._error_flash_alpha - 10)
+        self.update(self._circle_rect)
 
-            self._idle_border_width += self._idle_glow_direction * 0.02
-            self._idle_border_width = clamp(self._idle_border_width, 2.0, 3.5)
-            needs_update = True
+    def _tick_idle(self) -> None:
+        """Advance the idle glow breathing, repainting only on visible change.
 
-        # Update error flash
+        The ~30 Hz idle timer is decimated 2:1 with a doubled increment: the
+        glow ramp is slow enough that ~15 Hz steps are visually identical,
+        at half the animation/paint work.
+        """
+        # Decay any leftover error flash (e.g. a direct error->idle switch),
+        # matching the other tick handlers
         if self._error_flash_alpha > 0:
             self._error_flash_alpha = max(0, self._error_flash_alpha - 10)
-            needs_update = True
-
-        if needs_update:
-            self.update()
+            self.update(self._circle_rect)
+        self._idle_tick ^= 1
+        if self._idle_tick:
+            return
+
+        self._idle_glow += self._idle_glow_direction * 0.016
+        if self._idle_glow >= 1.0:
+            self._idle_glow_direction = -1
+        elif self._idle_glow <= 0.4:
+            self._idle_glow_direction = 1
+
+        self._idle_border_width += self._idle_glow_direction * 0.04
+        self._idle_border_width = clamp(self._idle_border_width, 2.0, 3.5)
+
+        # Only repaint when the glow crosses an 8-bit alpha step or the
+        # border width moves a quarter pixel; sub-quantum ticks render
+        # identically to the previous frame
+        q_glow = int(self._idle_glow * 255)
+        q_border = int(self._idle_border_width * 4)
+        if q_glow != self._last_painted_glow or q_border != self._last_painted_border_w:
+            self._last_painted_glow = q_glow
+            self._last_painted_border_w = q_border
+            self.update(self._circle_rect)
+
+    def _tick_error(self) -> None:
+        """Decay the red error-flash overlay."""
+        if self._error_flash_alpha > 0:
+            self._error_flash_alpha = max(0, self._error_flash_alpha - 10)
+            self.update(self._circle_rect)
 
     def _clear_error(self) -> None:
         """Clear error state."""
         self._state = STATE_IDLE
+        self._tick = self._tick_idle
+        # The flash may not have fully decayed (e.g. widget hidden, animation
+        # timer stopped); drop it with the error state
+        self._error_flash_alpha = 0
+        self._state_color = self._state_colors[STATE_IDLE]
         self.update()
 
     def paintEvent(self, event: QPaintEvent) -> None:
         """Draw the bar strip + circle widget."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Animation/sampler ticks dirty sub-rects (update(self._circle_rect) /
+        # update(self._strip_rect)); clipping to the requested region lets the
+        # paint engine discard overdraw outside it instead of rasterizing the
+        # full widget every time
+        painter.setClipRegion(event.region())
 
-        # Circle is right-anchored within bounding rect
+        # Circle is right-anchored within bounding rect; centers precomputed
         circle_size = self._size
-        cx = self.width() - circle_size / 2
-        cy = circle_size / 2
-        center = QPointF(cx, cy)
+        center = self._center
+        center_i = self._center_i
         radius = (circle_size / 2) - 4
+        radius_i = circle_size // 2 - 4
 
-        # Bar strip lives to the LEFT of the circle, only during recording
-        if self._state == STATE_RECORDING:
-            self._draw_bar_strip(painter, circle_size)
+        # Animation ticks dirty only the circle; sampler ticks only the strip
+        in_circle = event.rect().intersects(self._circle_rect)
+        in_strip = (
+            self._state == STATE_RECORDING
+            and event.rect().intersects(self._strip_rect)
+        )
 
-        # Circle background + border
-        self._draw_background(painter, center, radius)
-        self._draw_border(painter, center, radius)
+        # Draws are grouped so the paint engine flushes pen/brush state as
+        # few times as possible: brush fills first, then strokes, then blits.
+        # Idle/error never animate the mic, so their background + icon come
+        # pre-composited as one pixmap; only the glow/border/flash layers are
+        # drawn procedurally on top.
+        static_base = self._state in (STATE_IDLE, STATE_ERROR)
+        if in_circle and static_base:
+            painter.drawPixmap(
+                self._circle_rect.topLeft(), self._static_base_pixmap(self._state)
+            )
 
-        # Motion cues behind the mic icon
-        if self._state == STATE_PROCESSING:
-            self._draw_processing_pulse(painter, center, radius)
-        elif self._state == STATE_IDLE:
-            self._draw_idle_glow(painter, center, radius)
+        # Phase 1 — NoPen fills: circle background and motion cues
+        if in_circle:
+            if not static_base:
+                self._draw_background(painter, center_i, radius_i)
+            if self._state == STATE_PROCESSING:
+                self._draw_processing_pulse(painter, center, radius)
+            elif self._state == STATE_IDLE:
+                self._draw_idle_glow(painter, center, radius)
+
+        # Phase 2 — strokes: circle border and the recording bar strip
+        if in_circle:
+            self._draw_border(painter, center_i, radius_i)
+        if in_strip:
+            self._draw_bar_strip(painter, circle_size)
 
+        # Phase 3 — pixmap blit and overlay fill.
         # Mic icon shown in all states; PNG colour matches state identity:
         # grey=idle, blue=recording, orange=processing, red=error.
-        self._draw_condenser_mic(painter, center)
-
-        # Error flash overlay (any state)
-        if self._error_flash_alpha > 0:
-            self._draw_error_flash(painter, center, radius)
+        if in_circle:
+            if not static_base:
+                self._draw_condenser_mic(painter, center_i)
+            if self._error_flash_alpha > 0:
+                self._draw_error_flash(painter, center, radius)
 
     def _draw_bar_strip(self, painter: QPainter, circle_size: int) -> None:
         """Render rolling 5-second volume strip extending LEFT of the circle.
@@ -511,40 +858,39 @@ class FloatingWidget(QWidget):
         left, faded to transparent. Each bar's height encodes the audio level
         captured at that point in time.
         """
-        strip_width = circle_size * BAR_STRIP_MULTIPLIER
-        strip_left = 0.0
-        strip_right = strip_width  # right edge of strip = left edge of circle bbox
-        strip_height = circle_size
-        center_y = strip_height / 2
+        center_y = circle_size / 2
+        max_half_height = (circle_size / 2) - 4
+
+        # Audio RMS rarely hits 1.0 — typical speech is 0.1..0.3. The kernel
+        # applies a sqrt curve to compress dynamic range so normal speaking
+        # volume pushes bars to ~50-70% of max height, shouting near 100%.
+        history, half_heights = _shape_strip_levels(
+            self._audio_history, self._history_pos, max_half_height
+        )
 
-        # Each bar gets equal horizontal slice
-        bar_slot = strip_width / NUM_BARS
-        bar_thickness = max(2.0, bar_slot * 0.6)
-        max_half_height = (strip_height / 2) - 4
+        # Collect each fade bucket's bars into one path so Qt strokes them in
+        # a single pass; i=0 oldest → leftmost, newest → next to the circle.
+        # Lookups are hoisted to locals - this loop runs per visible bar at
+        # the sampler rate.
+        strip_x = self._strip_x
+        strip_bucket = self._strip_bucket
+        make_path = QPainterPath
+        paths: list[QPainterPath | None] = [None] * NUM_FADE_BUCKETS
+        for i in np.nonzero(history > 0.02)[0]:
+            x = strip_x[i]
+            half_h = half_heights[i]
+            bucket = strip_bucket[i]
+            path = paths[bucket]
+            if path is None:
+                path = paths[bucket] = make_path()
+            path.moveTo(x, center_y - half_h)
+            path.lineTo(x, center_y + half_h)
 
-        base_color = QColor(COLOR_WIDGET_RECORDING)
-        history = list(self._audio_history)  # snapshot to avoid mid-paint mutation
-
-        for i, level in enumerate(history):
-            if level <= 0.02:
-                continue
-            # i=0 oldest → leftmost; i=NUM_BARS-1 newest → rightmost (next to circle)
-            x = strip_left + (i + 0.5) * bar_slot
-            # Audio RMS rarely hits 1.0 — typical speech is 0.1..0.3. Apply a
-            # sqrt curve to compress dynamic range so normal speaking volume
-            # pushes bars to ~50-70% of max height, with shouting near 100%.
-            shaped = math.sqrt(clamp(level, 0.0, 1.0))
-            half_h = shaped * max_half_height
-            # Linear fade: opacity ramps from 0 at left edge to 1 at the circle
-            fade = (i + 1) / NUM_BARS
-            color = QColor(base_color)
-            color.setAlphaF(0.85 * fade)
-            pen = QPen(color, bar_thickness, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
-            painter.setPen(pen)
-            painter.drawLine(
-                QPointF(x, center_y - half_h),
-                QPointF(x, center_y + half_h),
-            )
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for bucket, path in enumerate(paths):
+            if path is not None:
+                painter.setPen(self._strip_bucket_pens[bucket])
+                painter.drawPath(path)
 
     def _draw_recording_dot(self, painter: QPainter, center: QPointF, radius: float) -> None:
         """Pulsing centre dot during recording. Color matches recording state."""
@@ -554,7 +900,7 @@ class FloatingWidget(QWidget):
         alpha = 0.55 + 0.45 * pulse
 
         dot_radius = radius * 0.32 * scale
-        color = QColor(COLOR_WIDGET_RECORDING)
+        color = self._recording_dot_color
         color.setAlphaF(alpha)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(color)
@@ -565,7 +911,7 @@ class FloatingWidget(QWidget):
         pulse = 0.5 - 0.5 * math.cos(self._yellow_pulse_phase * 2 * math.pi)
         alpha = 0.30 + 0.55 * pulse  # 0.30..0.85
 
-        color = QColor(COLOR_WIDGET_PROCESSING)
+        color = self._processing_color
         color.setAlphaF(alpha)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(color)
@@ -573,145 +919,243 @@ class FloatingWidget(QWidget):
         painter.drawEllipse(center, radius - 1, radius - 1)
 
     def _draw_outer_glow(self, painter: QPainter, center: QPointF, radius: float) -> None:
-        """Draw intense outer glow during recording."""
-        color = QColor(COLOR_WIDGET_RECORDING)
+        """Draw intense outer glow during recording.
 
-        # Multiple glow layers for richness
-        for i in range(3):
-            glow_radius = radius + 8 + i * 6
-            alpha = clamp(self._glow_intensity * (0.4 - i * 0.1))
-
-            gradient = QRadialGradient(center, glow_radius)
-            color.setAlphaF(0.0)
-            gradient.setColorAt(0.6, color)
-            color.setAlphaF(alpha)
-            gradient.setColorAt(1.0, color)
+        The old three translucent layers are folded into one multi-stop
+        gradient over the outermost radius - the layered look came from
+        alpha plateaus, which the extra stops reproduce in a single fill.
+        """
+        color = self._recording_dot_color
+        glow_radius = radius + 20
+        intensity = self._glow_intensity
+
+        gradient = self._glow_gradients["outer"]
+        gradient.setCenter(center)
+        gradient.setFocalPoint(center)
+        gradient.setRadius(glow_radius)
+        color.setAlphaF(0.0)
+        gradient.setColorAt(0.6, color)
+        color.setAlphaF(clamp(intensity * 0.4))
+        gradient.setColorAt(0.75, color)
+        color.setAlphaF(clamp(intensity * 0.3))
+        gradient.setColorAt(0.9, color)
+        color.setAlphaF(clamp(intensity * 0.2))
+        gradient.setColorAt(1.0, color)
 
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(gradient)
-            painter.drawEllipse(center, glow_radius, glow_radius)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(gradient)
+        painter.drawEllipse(center, glow_radius, glow_radius)
 
     def _draw_pulse_rings(self, painter: QPainter, center: QPointF, radius: float) -> None:
-        """Draw expanding pulse rings."""
+        """Draw expanding pulse rings as one multi-stop gradient fill.
+
+        All rings are concentric, so instead of stroking an ellipse per ring
+        they become narrow color bands in a single QRadialGradient, filled
+        with one drawEllipse - one rasterization pass over the union rect.
+        """
+        active = [ring for ring in self._pulse_rings if ring.active]
+        if not active:
+            return
+
         color = QColor(COLOR_WIDGET_RECORDING)
+        transparent = QColor(color)
+        transparent.setAlphaF(0.0)
         base_thickness = self._get_scaled_thickness(2.0)
+        max_radius = radius + self._size * 0.3
+
+        gradient = QRadialGradient(center, max_radius)
+        gradient.setColorAt(0.0, transparent)
+        for ring in sorted(active, key=lambda r: r.progress):
+            ring_radius = radius + ring.progress * self._size * 0.3
+            position = ring_radius / max_radius
+            # Band half-width matches the old pen thickness, which shrank as
+            # the ring expanded
+            half_band = base_thickness * (1 - ring.progress * 0.5) / 2 / max_radius
+            ring_color = QColor(color)
+            ring_color.setAlphaF(clamp(ring.opacity * 0.6))
+            gradient.setColorAt(max(0.0, position - half_band), transparent)
+            gradient.setColorAt(min(1.0, position), ring_color)
+            gradient.setColorAt(min(1.0, position + half_band), transparent)
 
-        for ring in self._pulse_rings:
-            if ring.active:
-                ring_radius = radius + ring.progress * self._size * 0.3
-                alpha = clamp(ring.opacity * 0.6)
-                color.setAlphaF(alpha)
-
-                pen = QPen(color, base_thickness * (1 - ring.progress * 0.5))
-                painter.setPen(pen)
-                painter.setBrush(Qt.BrushStyle.NoBrush)
-                painter.drawEllipse(center, ring_radius, ring_radius)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(gradient)
+        painter.drawEllipse(center, max_radius, max_radius)
 
     def _draw_vertical_audio_bars(self, painter: QPainter, center: QPointF) -> None:
         """Draw vertical audio-reactive bars overlaid on the mic icon."""
         # Bar visual properties
         bar_width = self._get_scaled_thickness(4.0)  # Rounded bar width
 
-        for bar in self._vertical_bars:
-            # Skip if bar is at minimum (no visual needed)
-            if bar.current_height <= bar.min_height * 1.1:
-                continue
-
-            # Calculate bar position (centered vertically on widget)
-            x = center.x() + bar.x_offset
-            half_height = bar.current_height / 2
-
+        bars = self._vertical_bars
+        cx = center.x()
+        cy = center.y()
+        # Bars at minimum need no visual; a single vector compare finds the
+        # rest. Bars sharing a color accumulate into one path so each color
+        # group costs a single drawPath instead of a drawLine per bar.
+        half_heights = bars.current_height * 0.5
+        x_offsets = bars.x_offsets
+        pen_group = bars.pen_group
+        make_path = QPainterPath
+        paths: list[QPainterPath | None] = [None] * len(bars.pens)
+        for i in np.nonzero(bars.current_height > bars.min_height * 1.1)[0]:
             # Bar extends equally above and below center
-            y_top = center.y() - half_height
-            y_bottom = center.y() + half_height
-
-            # Set bar color with 30% opacity
-            color = QColor(bar.color)
-            color.setAlphaF(0.30)
+            x = cx + x_offsets[i]
+            half_height = half_heights[i]
+            group = pen_group[i]
+            path = paths[group]
+            if path is None:
+                path = paths[group] = make_path()
+            path.moveTo(x, cy - half_height)
+            path.lineTo(x, cy + half_height)
 
-            # Draw rounded vertical bar
-            pen = QPen(color, bar_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
-            painter.setPen(pen)
-            painter.drawLine(QPointF(x, y_top), QPointF(x, y_bottom))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for group, path in enumerate(paths):
+            if path is not None:
+                pen = bars.pens[group]
+                pen.setWidthF(bar_width)
+                painter.setPen(pen)
+                painter.drawPath(path)
 
-    def _draw_background(self, painter: QPainter, center: QPointF, radius: float) -> None:
+    def _draw_background(self, painter: QPainter, center: QPoint, radius: int) -> None:
         """Draw the dark circular background with 10% transparency."""
         painter.setPen(Qt.PenStyle.NoPen)
-        bg_color = QColor(COLOR_BG_DARK)
-        bg_color.setAlphaF(0.10)
-        painter.setBrush(bg_color)
+        painter.setBrush(self._bg_color)
         painter.drawEllipse(center, radius, radius)
 
-    def _draw_border(self, painter: QPainter, center: QPointF, radius: float) -> None:
+    def _draw_border(self, painter: QPainter, center: QPoint, radius: int) -> None:
         """Draw the colored border."""
-        color = self._get_state_color()
+        color = self._state_color
 
         base_width = 2.5
         if self._state == STATE_IDLE:
             base_width = self._idle_border_width
-            color.setAlphaF(clamp(self._idle_glow))
+            color = self._idle_border_palette[int(clamp(self._idle_glow) * 31)]
         elif self._state == STATE_RECORDING:
             # Thicker, brighter border during recording
             base_width = 3.0 + self._smoothed_audio * 1.5
-            color.setAlphaF(clamp(0.8 + self._smoothed_audio * 0.2))
+            color = self._recording_border_palette[int(clamp(self._smoothed_audio) * 31)]
 
         border_width = self._get_scaled_thickness(base_width)
-        pen = QPen(color, border_width)
-        painter.setPen(pen)
+        self._border_pen.setColor(color)
+        self._border_pen.setWidthF(border_width)
+        painter.setPen(self._border_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawEllipse(center, radius, radius)
 
-    def _draw_idle_glow(self, painter: QPainter, center: QPointF, radius: float) -> None:
-        """Draw subtle glow during idle state."""
-        color = QColor(COLOR_WIDGET_IDLE)
-        glow_radius = radius + 3
-
+    def _build_idle_glow_sprite(self) -> QPixmap:
+        """Pre-render the idle glow gradient at full intensity."""
+        # Glow radius = circle radius (size/2 - 4) + 3
+        glow_radius = self._size / 2 - 1
+        diameter = int(glow_radius * 2) + 2
+        sprite = QPixmap(diameter, diameter)
+        sprite.fill(Qt.GlobalColor.transparent)
+
+        sprite_painter = QPainter(sprite)
+        sprite_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        center = QPointF(diameter / 2, diameter / 2)
         gradient = QRadialGradient(center, glow_radius)
+        color = QColor(self._idle_glow_color)
         color.setAlphaF(0.0)
         gradient.setColorAt(0.7, color)
-        color.setAlphaF(clamp(self._idle_glow * 0.2))
+        color.setAlphaF(0.2)
         gradient.setColorAt(1.0, color)
+        sprite_painter.setPen(Qt.PenStyle.NoPen)
+        sprite_painter.setBrush(gradient)
+        sprite_painter.drawEllipse(center, glow_radius, glow_radius)
+        sprite_painter.end()
+        return sprite
 
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(gradient)
-        painter.drawEllipse(center, glow_radius, glow_radius)
+    def _draw_idle_glow(self, painter: QPainter, center: QPointF, radius: float) -> None:
+        """Blit the pre-rendered glow, scaled by the breathing intensity."""
+        sprite = self._idle_glow_sprite
+        painter.setOpacity(clamp(self._idle_glow))
+        painter.drawPixmap(
+            int(center.x() - sprite.width() / 2),
+            int(center.y() - sprite.height() / 2),
+            sprite,
+        )
+        painter.setOpacity(1.0)
 
-    def _draw_condenser_mic(self, painter: QPainter, center: QPointF) -> None:
+    def _draw_condenser_mic(self, painter: QPainter, center: QPoint) -> None:
         """Draw microphone icon from PNG asset."""
-        # Get the appropriate icon file for current state
-        icon_file = ICON_FILES.get(self._state, ICON_FILES['idle'])
-        icon_path = os.path.join(ASSETS_DIR, icon_file)
-
-        # Load the pixmap
-        pixmap = QPixmap(icon_path)
-        if pixmap.isNull():
-            return  # Fallback: don't draw if image not found
-
-        # Calculate icon size (with breathing effect for processing state)
+        # Calculate icon size (with breathing effect for processing state).
+        # icon_size is quantized to whole pixels, so the cache hits on nearly
+        # every frame even while breathing animates.
         icon_size = int(self._size * 0.5)
         if self._state == STATE_PROCESSING:
             icon_size = int(icon_size * self._breathing_scale)
 
-        # Scale the pixmap with smooth transformation
-        scaled = pixmap.scaled(
-            icon_size, icon_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        key = (self._state, icon_size)
+        scaled = self._scaled_icon(self._state, icon_size)
+        if scaled is None:
+            return  # Fallback: don't draw if image not found
 
-        # Calculate position to center the icon
-        x = int(center.x() - scaled.width() / 2)
-        y = int(center.y() - scaled.height() / 2)
+        # Centering arithmetic runs once per (state, icon_size); steady-state
+        # frames go straight from cache to the blit
+        pos = self._icon_pos_cache.get(key)
+        if pos is None:
+            pos = QPoint(
+                center.x() - scaled.width() // 2,
+                center.y() - scaled.height() // 2,
+            )
+            self._icon_pos_cache[key] = pos
 
         # Draw the icon
-        painter.drawPixmap(x, y, scaled)
+        painter.drawPixmap(pos, scaled)
+
+    def _scaled_icon(self, state: str, icon_size: int) -> QPixmap | None:
+        """Return the mic icon scaled for a state/size pair, caching the result."""
+        key = (state, icon_size)
+        scaled = self._scaled_icon_cache.get(key)
+        if scaled is None:
+            pixmap = _raw_pixmap(state)
+            if pixmap.isNull():
+                return None
+
+            # Scale the pixmap with smooth transformation (once per key)
+            scaled = pixmap.scaled(
+                icon_size, icon_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self._scaled_icon_cache[key] = scaled
+        return scaled
+
+    def _static_base_pixmap(self, state: str) -> QPixmap:
+        """Composite the circle background + mic icon for a static state.
+
+        Idle and error never animate the icon, so their whole static layer
+        is rendered once per (state, size) and blitted as a single pixmap.
+        """
+        pixmap = self._static_base_cache.get(state)
+        if pixmap is None:
+            size = self._size
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            base_painter = QPainter(pixmap)
+            base_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            center = QPoint(size // 2, size // 2)
+            self._draw_background(base_painter, center, size // 2 - 4)
+            scaled = self._scaled_icon(state, int(size * 0.5))
+            if scaled is not None:
+                base_painter.drawPixmap(
+                    center.x() - scaled.width() // 2,
+                    center.y() - scaled.height() // 2,
+                    scaled,
+                )
+            base_painter.end()
+            self._static_base_cache[state] = pixmap
+        return pixmap
 
     def _draw_processing_glow(self, painter: QPainter, center: QPointF, radius: float) -> None:
         """Draw breathing glow during processing."""
-        color = QColor(COLOR_WIDGET_PROCESSING)
+        color = self._processing_color
 
         glow_radius = radius * self._breathing_scale + 5
-        gradient = QRadialGradient(center, glow_radius)
+        gradient = self._glow_gradients["processing"]
+        gradient.setCenter(center)
+        gradient.setFocalPoint(center)
+        gradient.setRadius(glow_radius)
         color.setAlphaF(0.0)
         gradient.setColorAt(0.5, color)
         alpha = clamp((self._breathing_scale - 1.0) * 2.5)
@@ -724,7 +1168,7 @@ class FloatingWidget(QWidget):
 
     def _draw_error_flash(self, painter: QPainter, center: QPointF, radius: float) -> None:
         """Draw red flash overlay for error state."""
-        color = QColor(COLOR_WIDGET_ERROR)
+        color = self._error_flash_color
         color.setAlpha(self._error_flash_alpha)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(color)
@@ -733,11 +1177,27 @@ class FloatingWidget(QWidget):
     def set_state(self, state: str, message: str = "") -> None:
         """Update widget state."""
         self._state = state
+        self._tick = self._ticks.get(state, self._tick_idle)
+        self._state_color = self._state_colors.get(state, self._state_colors[STATE_IDLE])
+        # Audio-reactive states animate at full rate; idle/error halve the
+        # timer wakeups since only the slow glow or flash decay is running.
+        # Recording also gets a precise timer for even frame pacing; a timer
+        # type change only takes effect on restart, hence start() when active.
+        self._animation_timer.setTimerType(
+            Qt.TimerType.PreciseTimer if state == STATE_RECORDING
+            else Qt.TimerType.CoarseTimer
+        )
+        if self._animation_timer.isActive():
+            self._animation_timer.start(self._animation_interval())
+        else:
+            # Hidden (hideEvent stopped the timer): just record the interval
+            self._animation_timer.setInterval(self._animation_interval())
 
         if state == STATE_RECORDING:
-            # Start the rolling-strip sampler. ~30Hz captures 5s × 30 = 150 samples;
-            # we keep NUM_BARS in the deque, so older samples drop off naturally.
-            self._audio_history = deque([0.0] * NUM_BARS, maxlen=NUM_BARS)
+            # Reset the rolling strip; the ring buffer overwrites oldest
+            # samples in place, so older values drop off naturally.
+            self._audio_history.fill(0.0)
+            self._history_pos = 0
             self._red_dot_phase = 0.0
             if not self._sample_timer.isActive():
                 self._sample_timer.start(int(self._sample_period_ms))
@@ -760,7 +1220,11 @@ class FloatingWidget(QWidget):
         Newest sample = right edge of strip = touching the circle.
         """
         # Use smoothed audio so a single noisy frame doesn't spike a single bar
-        self._audio_history.append(self._smoothed_audio)
+        self._audio_history[self._history_pos] = self._smoothed_audio
+        self._history_pos = (self._history_pos + 1) % NUM_BARS
+        # The strip only changes when a sample lands, so repaint it here at
+        # the ~12 Hz sample rate rather than on every 60 Hz animation tick
+        self.update(self._strip_rect)
 
     def set_audio_level(self, level: float) -> None:
         """Update audio level for reactive animations."""
@@ -796,13 +1260,26 @@ class FloatingWidget(QWidget):
         """Handle drag."""
         if event.buttons() == Qt.MouseButton.LeftButton and self._drag_start_pos:
             delta = event.globalPosition().toPoint() - self._drag_start_pos
-            self._total_drag_distance = abs(delta.x()) + abs(delta.y())
+            # C++-side manhattanLength, and only until the click-vs-drag
+            # threshold is crossed - past that the exact distance is unused
+            if self._total_drag_distance < 5:
+                self._total_drag_distance = delta.manhattanLength()
 
             if self._drag_start_widget_pos:
                 new_pos = self._drag_start_widget_pos + delta
-                self.move(new_pos)
+                # Coalesce: queue the move and flush once per event-loop
+                # pass, so a 120 Hz mouse doesn't force 120 re-composites
+                if self._pending_move is None:
+                    QTimer.singleShot(0, self._flush_move)
+                self._pending_move = new_pos
             event.accept()
 
+    def _flush_move(self) -> None:
+        """Apply the most recent queued drag position."""
+        if self._pending_move is not None:
+            self.move(self._pending_move)
+            self._pending_move = None
+
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Handle mouse release."""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -0,0 +1,54 @@
+"""Shared source-file cache for the verification scripts in tests/.
+
+Verification scripts inspect the same ``src/**/*.py`` files; this module
+maps each file once per (path, mtime) and shares the read-only mapping
+process-wide, so a file inspected by several scripts in one process costs
+a stat instead of a fresh read. The kernel page cache backs the bytes, so
+scans never materialize a heap copy of the file.
+
+NOTE: mmap objects have no __contains__, so substring probes must use
+``content.find(b'...') != -1`` — a bare ``in`` would silently compare the
+pattern against the ints yielded by iteration and return False.
+"""
+
+import atexit
+import mmap
+import os
+
+# Repository root (tests/ lives directly under it)
+WORKING_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (absolute path, st_mtime_ns) -> mmap; a stale mapping for a file edited
+# mid-process stays cached until exit, which is bounded and harmless for
+# short-lived verification runs
+_CACHE = {}
+
+
+def get_source(rel_path):
+    """Memory-map a source file as a read-only bytes-like object.
+
+    ``rel_path`` is relative to the repository root. Binary mode skips the
+    UTF-8 decode - every caller probes ASCII substrings or patterns, so
+    Unicode semantics are never needed.
+    """
+    full_path = os.path.join(WORKING_DIR, rel_path)
+    key = (full_path, os.stat(full_path).st_mtime_ns)
+    mapped = _CACHE.get(key)
+    if mapped is None:
+        fd = os.open(full_path, os.O_RDONLY)
+        try:
+            fresh = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        # setdefault so a concurrent first read keeps exactly one mapping
+        mapped = _CACHE.setdefault(key, fresh)
+        if mapped is not fresh:
+            fresh.close()
+    return mapped
+
+
+@atexit.register
+def _close_all():
+    for mapped in _CACHE.values():
+        mapped.close()
+    _CACHE.clear()